@@ -5,11 +5,15 @@ ShootProof CSV Importer for Photography Database
 Imports contacts and orders from ShootProof CSV exports into SurrealDB.
 """
 
+import asyncio
 import csv
+import sys
 import argparse
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from surrealdb import Surreal
+from surrealdb import AsyncSurreal, RecordID
 
 DB_URL = "ws://127.0.0.1:8000/rpc"
 DB_NS = "photography"
@@ -17,217 +21,546 @@ DB_NAME = "ops"
 DB_USER = "root"
 DB_PASS = "root"
 
+# CSV rows parsed, looked up and written per chunk
+BATCH_SIZE = 500
 
-def import_contacts(db, csv_path: str, dry_run: bool = False):
-    """Import contacts CSV into family records."""
+# Bytes read from disk at a time; rows are streamed a chunk at a time, never the whole file
+READ_BUFFER_SIZE = 1 << 20
+
+# Connections shared by concurrent lookups and writes
+POOL_SIZE = 4
+
+# Family ID is the lowercased last name with spaces -> '_' and apostrophes dropped
+FAMILY_ID_TABLE = str.maketrans({' ': '_', "'": None})
+
+# CSV rows between progress lines (per-row lines need --verbose)
+PROGRESS_EVERY = 1000
+
+# Existence lookups, stored as fn::existing_* on a real import and sent inline on a dry run
+FAMILY_LOOKUP_SQL = "SELECT VALUE meta::id(id) FROM array::map($ids, |$id| type::thing('family', $id))"
+ORDER_LOOKUP_SQL = "SELECT VALUE shootproof_order_id FROM order WHERE shootproof_order_id INSIDE $ids"
+
+
+class SurrealPool:
+    """Fixed-size pool of SurrealDB connections.
+
+    A single WebSocket connection serialises requests, so independent queries
+    (e.g. the family and order lookups for a chunk) each take their own
+    connection and run concurrently.
+    """
+
+    def __init__(self, size: int = POOL_SIZE):
+        self.size = size
+        self._idle = asyncio.Queue()
+
+    async def _connect(self):
+        db = AsyncSurreal(DB_URL)
+        await db.connect()
+        await db.signin({"username": DB_USER, "password": DB_PASS})
+        await db.use(DB_NS, DB_NAME)
+        self._idle.put_nowait(db)
+
+    async def open(self):
+        await asyncio.gather(*(self._connect() for _ in range(self.size)))
+
+    async def query(self, sql: str, params: dict = None):
+        db = await self._idle.get()
+        try:
+            return await db.query(sql, params)
+        finally:
+            self._idle.put_nowait(db)
+
+    async def execute(self, statements: list, params: dict = None, transaction: bool = True):
+        """Send statements as a single script in one round-trip, raising if any fails.
+
+        By default the script is one transaction, so a chunk's writes commit
+        together (all or nothing) instead of every statement separately.
+        """
+        if transaction:
+            statements = ["BEGIN TRANSACTION", *statements, "COMMIT TRANSACTION"]
+        script = ";\n".join(statements)
+
+        db = await self._idle.get()
+        try:
+            response = await db.query_raw(script, params)
+        finally:
+            self._idle.put_nowait(db)
+
+        # RPC-level failures (parse, auth, permissions) carry no per-statement results;
+        # query_raw doesn't raise for them
+        if response.get("error") or "result" not in response:
+            raise RuntimeError(f"SurrealDB write failed: {response.get('error', response)}")
+
+        # A failed transaction marks every statement ERR; report each distinct cause once
+        errors = [
+            str(result.get("result"))
+            for result in response["result"]
+            if result.get("status") == "ERR"
+        ]
+        if errors:
+            raise RuntimeError(f"SurrealDB write failed: {'; '.join(dict.fromkeys(errors))}")
+
+    async def close(self):
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
+
+
+async def define_schema(pool, dry_run: bool = False):
+    """Define the functions and indexes the importer's lookups rely on.
+
+    Nothing is defined on a dry run; the lookups send their SQL inline instead.
+    """
+    if dry_run:
+        return
+
+    # Checked like writes: a missing function or index must stop the import,
+    # e.g. the UNIQUE index fails if existing orders share a shootproof_order_id
+    await pool.execute(
+        [
+            # Lookups are sent per chunk; defining them once means each call only
+            # parses a short RETURN statement
+            f"""DEFINE FUNCTION OVERWRITE fn::existing_families($ids: array<string>) {{
+                RETURN ({FAMILY_LOOKUP_SQL});
+            }}""",
+            f"""DEFINE FUNCTION OVERWRITE fn::existing_orders($ids: array<int>) {{
+                RETURN ({ORDER_LOOKUP_SQL});
+            }}""",
+            # Makes the shootproof_order_id dedup lookup an index probe instead of a table scan
+            "DEFINE INDEX IF NOT EXISTS order_shootproof_id ON TABLE order COLUMNS shootproof_order_id UNIQUE",
+        ],
+        transaction=False,
+    )
+
+
+def open_csv(csv_path: str):
+    """Open a CSV export for csv.reader, stripping the BOM and leaving newlines untranslated."""
+    return open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=READ_BUFFER_SIZE)
+
+
+def column_index(reader) -> dict:
+    """Consume the header row and return a column-name -> index map."""
+    return {name: i for i, name in enumerate(next(reader, []))}
+
+
+def column(columns: dict, name: str):
+    """Return a getter for a stripped column value, '' if the column is absent."""
+    i = columns.get(name)
+    if i is None:
+        return lambda row: ''
+    return lambda row: row[i].strip() if i < len(row) else ''
+
+
+def int_column(columns: dict, name: str):
+    """Return a getter for a numeric ID column, None if blank, non-numeric or absent."""
+    get = column(columns, name)
+
+    def get_int(row):
+        value = get(row)
+        return int(value) if value.isdecimal() else None
+
+    return get_int
+
+
+def report_progress(label: str, rows_before: int, rows_after: int):
+    """Write a progress line whenever the row count crosses a PROGRESS_EVERY boundary."""
+    if rows_after // PROGRESS_EVERY > rows_before // PROGRESS_EVERY:
+        sys.stdout.write(f"  ... {label}: {rows_after} rows\n")
+
+
+def iter_chunks(reader, size: int):
+    """Yield successive lists of up to `size` rows from a CSV reader, skipping blank lines."""
+    while True:
+        chunk = list(islice(reader, size))
+        if not chunk:
+            return
+        # csv.reader yields [] for blank lines (csv.DictReader skipped them); they aren't skipped rows
+        rows = [row for row in chunk if row]
+        if rows:
+            yield rows
+
+
+@lru_cache(maxsize=None)
+def parse_order_date(order_date: str) -> str:
+    """Convert a ShootProof order date to ISO 8601, returning it unchanged if unparseable.
+
+    Cached because an export only contains a few hundred distinct dates.
+    """
+    try:
+        if ',' in order_date:  # "Jan 2, 2025" format
+            parsed_date = datetime.strptime(order_date, "%b %d, %Y")
+        else:
+            parsed_date = datetime.strptime(order_date, "%Y-%m-%d")
+        return parsed_date.isoformat()
+    except (ValueError, TypeError):
+        return order_date
+
+
+def parse_amount(amount: str) -> float:
+    """Convert a ShootProof money column ("1,234.56") to a float, 0.0 if blank or invalid."""
+    if not amount:
+        return 0.0
+    if ',' in amount:
+        amount = amount.replace(',', '')
+    try:
+        return float(amount)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def lookup_result(existing) -> set:
+    """Turn a lookup's result into a set, raising if the query returned an error instead."""
+    # query() hands back a failed statement's error string rather than raising
+    if existing is None:
+        return set()
+    if not isinstance(existing, list):
+        raise RuntimeError(f"SurrealDB lookup failed: {existing}")
+    return set(existing)
+
+
+async def cancel_and_wait(*tasks):
+    """Cancel any unfinished tasks and wait for them all, swallowing their errors."""
+    tasks = [task for task in tasks if task]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def fetch_existing_families(pool, family_ids, dry_run: bool = False) -> set:
+    """Return the subset of family_ids that already have a family record."""
+    if not family_ids:
+        return set()
+
+    existing = await pool.query(
+        FAMILY_LOOKUP_SQL if dry_run else "RETURN fn::existing_families($ids)",
+        {"ids": sorted(family_ids)}
+    )
+    return lookup_result(existing)
+
+
+async def fetch_existing_orders(pool, order_ids, dry_run: bool = False) -> set:
+    """Return the subset of ShootProof order IDs that already have an order record."""
+    if not order_ids:
+        return set()
+
+    existing = await pool.query(
+        ORDER_LOOKUP_SQL if dry_run else "RETURN fn::existing_orders($ids)",
+        {"ids": sorted(order_ids)}
+    )
+    return lookup_result(existing)
+
+
+async def write_families(pool, families: list):
+    """Create each {"id", "data"} family, or merge into it if it exists, in one UPSERT loop."""
+    if not families:
+        return
+
+    await pool.execute(
+        [
+            """FOR $f IN $families {
+                UPSERT type::thing('family', $f.id) MERGE $f.data RETURN NONE;
+            }"""
+        ],
+        {"families": families}
+    )
+
+
+async def write_orders(pool, new_families: list, orders: list):
+    """Insert a batch of orders and any missing families, and link them, in one script."""
+    statements = []
+    if new_families:
+        statements.append("INSERT INTO family $new_families RETURN NONE")
+    if orders:
+        statements.append("INSERT INTO order $orders RETURN NONE")
+        # The new order ids stay server-side; find each one again by its
+        # (uniquely indexed) ShootProof order ID to relate it
+        statements.append(
+            """FOR $r IN $rels {
+                LET $order = (SELECT VALUE id FROM order WHERE shootproof_order_id = $r.shootproof_order_id LIMIT 1)[0];
+                RELATE (type::thing('family', $r.family_id))->ordered->$order SET
+                    amount = $r.amount,
+                    order_date = $r.date
+                RETURN NONE;
+            }"""
+        )
+    if not statements:
+        return
+
+    rels = [
+        {
+            "family_id": family_id,
+            "shootproof_order_id": order_data['shootproof_order_id'],
+            "amount": order_data['total_sales'],
+            "date": order_data['order_date']
+        }
+        for family_id, order_data in orders
+    ]
+    await pool.execute(statements, {
+        "new_families": new_families,
+        "orders": [order_data for _, order_data in orders],
+        "rels": rels,
+    })
+
+
+async def import_contacts(pool, csv_path: str, dry_run: bool = False, verbose: bool = False,
+                          known_families: set = None, families_ready: asyncio.Event = None):
+    """Import contacts CSV into family records.
+
+    known_families is updated in place with every family that exists once the
+    import completes, so a following import_orders can skip looking them up.
+    families_ready is set once all family writes have finished.
+    """
 
     print(f"\n{'[DRY RUN] ' if dry_run else ''}Importing contacts from: {csv_path}")
 
     created = 0
     updated = 0
     skipped = 0
+    rows_read = 0
+    existing_families = known_families if known_families is not None else set()
+    pending_write = None
 
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            # Extract fields
-            contact_id = row.get('Contact ID', '').strip()
-            first_name = row.get('First Name', '').strip()
-            last_name = row.get('Last Name', '').strip()
-            email = row.get('Email', '').strip()
-            phone = row.get('Phone', '').strip()
-            galleries = row.get('Galleries', '').strip()
-            created_at = row.get('Created', '').strip()
-
-            if not last_name:
-                skipped += 1
-                continue
-
-            # Family ID is lowercase last name
-            family_id = last_name.lower().replace(' ', '_').replace("'", "")
-
-            # Check if family exists
-            existing = db.query(
-                "SELECT * FROM family WHERE id = type::thing('family', $id)",
-                {"id": family_id}
-            )
-
-            # Build full name
-            full_name = f"{first_name} {last_name}".strip() if first_name else last_name
-
-            family_data = {
-                "name": full_name,  # Required field
-                "last_name": last_name,
-                "shootproof_contact_id": int(contact_id) if contact_id.isdigit() else None,
-            }
-
-            # Only set email if we have one
-            if email:
-                family_data["delivery_email"] = email
-            if phone:
-                family_data["phone"] = phone
-            if galleries:
-                family_data["galleries"] = [g.strip() for g in galleries.split(',')]
-
-            # surrealdb Python client returns [] when empty, or list of records when found
-            has_existing = existing and len(existing) > 0
-
-            if has_existing:
-                # Update existing
-                if not dry_run:
-                    db.query(
-                        """UPDATE type::thing('family', $id) MERGE $data""",
-                        {"id": family_id, "data": family_data}
-                    )
-                updated += 1
-                print(f"  Updated: {last_name}")
-            else:
-                # Create new
+    try:
+        with open_csv(csv_path) as f:
+            reader = csv.reader(f)
+            columns = column_index(reader)
+            get_contact_id = int_column(columns, 'Contact ID')
+            get_first_name = column(columns, 'First Name')
+            get_last_name = column(columns, 'Last Name')
+            get_email = column(columns, 'Email')
+            get_phone = column(columns, 'Phone')
+            get_galleries = column(columns, 'Galleries')
+
+            for rows in iter_chunks(reader, BATCH_SIZE):
+                families = []
+
+                # Drop rows without a last name up front; they can't be keyed to a family
+                named = [
+                    (last_name, row)
+                    for last_name, row in zip(map(get_last_name, rows), rows)
+                    if last_name
+                ]
+                skipped += len(rows) - len(named)
+
+                for last_name, row in named:
+                    # Extract fields
+                    first_name = get_first_name(row)
+                    email = get_email(row)
+                    phone = get_phone(row)
+                    galleries = get_galleries(row)
+
+                    # Family ID is lowercase last name
+                    family_id = last_name.lower().translate(FAMILY_ID_TABLE)
+
+                    # Build full name
+                    full_name = f"{first_name} {last_name}".strip() if first_name else last_name
+
+                    family_data = {
+                        "name": full_name,  # Required field
+                        "last_name": last_name,
+                        "shootproof_contact_id": get_contact_id(row),
+                    }
+
+                    # Only set email if we have one
+                    if email:
+                        family_data["delivery_email"] = email
+                    if phone:
+                        family_data["phone"] = phone
+                    if galleries:
+                        family_data["galleries"] = [g.strip() for g in galleries.split(',')]
+
+                    families.append((family_id, last_name, family_data))
+
+                # The UPSERT doesn't need this lookup; it only splits the summary
+                # into created vs updated (one query per chunk for unseen families)
+                existing_families |= await fetch_existing_families(
+                    pool, {family_id for family_id, _, _ in families} - existing_families, dry_run
+                )
+
+                for family_id, last_name, _ in families:
+                    if family_id in existing_families:
+                        updated += 1
+                        if verbose:
+                            print(f"  Updated: {last_name}")
+                    else:
+                        # Later rows with the same last name update this record
+                        existing_families.add(family_id)
+                        created += 1
+                        if verbose:
+                            print(f"  Created: {last_name}")
+
+                # Overlap this chunk's write with parsing the next; writes stay in order
+                if pending_write:
+                    await pending_write
                 if not dry_run:
-                    db.query(
-                        """CREATE type::thing('family', $id) CONTENT $data""",
-                        {"id": family_id, "data": family_data}
-                    )
-                created += 1
-                print(f"  Created: {last_name}")
+                    pending_write = asyncio.create_task(write_families(
+                        pool, [{"id": family_id, "data": family_data} for family_id, _, family_data in families]
+                    ))
+
+                report_progress('contacts', rows_read, rows_read + len(rows))
+                rows_read += len(rows)
+
+        if pending_write:
+            await pending_write
+    finally:
+        # On failure, don't leave a write or lookup running on a pooled connection
+        await cancel_and_wait(pending_write)
+
+    if families_ready:
+        families_ready.set()
 
     print(f"\nContacts summary: {created} created, {updated} updated, {skipped} skipped")
     return created, updated, skipped
 
 
-def import_orders(db, csv_path: str, dry_run: bool = False):
-    """Import orders CSV into order records."""
+async def import_orders(pool, csv_path: str, dry_run: bool = False, verbose: bool = False,
+                        known_families: set = None, families_ready: asyncio.Event = None):
+    """Import orders CSV into order records.
+
+    Families in known_families are assumed to exist and are not looked up.
+    If families_ready is given, the first chunk is parsed and its order lookup
+    sent straight away; everything after that waits until it is set.
+    """
 
     print(f"\n{'[DRY RUN] ' if dry_run else ''}Importing orders from: {csv_path}")
 
     created = 0
     skipped = 0
+    rows_read = 0
     families_not_found = set()
+    existing_families = known_families if known_families is not None else set()
+    existing_orders = set()
+    pending_write = None
+    family_lookup = None
+    order_lookup = None
 
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            order_id = row.get('Order ID', '').strip()
-            order_date = row.get('Order Date', '').strip()
-            gallery = row.get('Gallery', '').strip()
-            customer_name = row.get('Customer Name', '').strip()
-            customer_email = row.get('Customer Email', '').strip()
-            total_sales = row.get('Total Sales', '0').strip().replace(',', '')
-            profit = row.get('Profit', '0').strip().replace(',', '')
-            items_ordered = row.get('Items Ordered', '').strip()
-
-            if not order_id or not gallery:
-                skipped += 1
-                continue
-
-            # Extract last name from gallery (usually "FirstName LastName" or just "LastName")
-            gallery_parts = gallery.split()
-            last_name = gallery_parts[-1] if gallery_parts else gallery
-            family_id = last_name.lower().replace(' ', '_').replace("'", "")
-
-            # Check if family exists
-            existing_family = db.query(
-                "SELECT * FROM family WHERE id = type::thing('family', $id)",
-                {"id": family_id}
-            )
-
-            # surrealdb Python client returns [] when empty, or list of records when found
-            has_family = existing_family and len(existing_family) > 0
-
-            if not has_family:
-                families_not_found.add(last_name)
-                # Create the family record
+    try:
+        with open_csv(csv_path) as f:
+            reader = csv.reader(f)
+            columns = column_index(reader)
+            get_order_id = int_column(columns, 'Order ID')
+            get_order_date = column(columns, 'Order Date')
+            get_gallery = column(columns, 'Gallery')
+            get_customer_name = column(columns, 'Customer Name')
+            get_customer_email = column(columns, 'Customer Email')
+            get_total_sales = column(columns, 'Total Sales')
+            get_profit = column(columns, 'Profit')
+            get_items_ordered = column(columns, 'Items Ordered')
+
+            for rows in iter_chunks(reader, BATCH_SIZE):
+                parsed = []
+
+                # Drop rows missing a numeric order ID or a gallery up front
+                keyed = [
+                    (order_id, gallery, row)
+                    for order_id, gallery, row in zip(map(get_order_id, rows), map(get_gallery, rows), rows)
+                    if order_id is not None and gallery
+                ]
+                skipped += len(rows) - len(keyed)
+
+                for order_id, gallery, row in keyed:
+                    order_date = get_order_date(row)
+                    customer_name = get_customer_name(row)
+                    customer_email = get_customer_email(row)
+                    items_ordered = get_items_ordered(row)
+
+                    # Extract last name from gallery (usually "FirstName LastName" or just "LastName")
+                    gallery_parts = gallery.split()
+                    last_name = gallery_parts[-1] if gallery_parts else gallery
+                    family_id = last_name.lower().translate(FAMILY_ID_TABLE)
+
+                    # Parse amounts
+                    total = parse_amount(get_total_sales(row))
+                    net_profit = parse_amount(get_profit(row))
+
+                    # Determine if this is a $0 order (comp/correction)
+                    is_comp = total == 0.0
+
+                    # Count items (one per line) and truncate for storage
+                    if items_ordered:
+                        item_count = items_ordered.count('\n') + 1
+                        items_raw = items_ordered[:500]
+                    else:
+                        item_count = 0
+                        items_raw = None
+
+                    order_data = {
+                        "shootproof_order_id": order_id,
+                        "order_date": parse_order_date(order_date),
+                        "gallery_name": gallery,
+                        "customer_name": customer_name,
+                        "customer_email": customer_email,
+                        "total_sales": total,
+                        "profit": net_profit,
+                        "is_comp": is_comp,
+                        "item_count": item_count,
+                        "items_raw": items_raw,
+                    }
+
+                    parsed.append((family_id, last_name, order_data))
+
+                # One lookup each per chunk for families and orders not already seen in this run
+                order_lookup = asyncio.create_task(fetch_existing_orders(
+                    pool, {order_data["shootproof_order_id"] for _, _, order_data in parsed} - existing_orders, dry_run
+                ))
+
+                # Families the contacts import is still writing must not be looked up (or created) yet
+                if families_ready:
+                    await families_ready.wait()
+
+                family_lookup = asyncio.create_task(fetch_existing_families(
+                    pool, {family_id for family_id, _, _ in parsed} - existing_families, dry_run
+                ))
+                found_families = await family_lookup
+                found_orders = await order_lookup
+                existing_families |= found_families
+                existing_orders |= found_orders
+
+                new_families = []
+                orders = []
+
+                for family_id, last_name, order_data in parsed:
+                    if family_id not in existing_families:
+                        existing_families.add(family_id)
+                        families_not_found.add(last_name)
+                        # Create the family record
+                        new_families.append({
+                            "id": RecordID("family", family_id),
+                            "name": order_data["gallery_name"],
+                            "last_name": last_name,
+                            "delivery_email": order_data["customer_email"],
+                        })
+
+                    # Skip orders already imported (including repeats within this file)
+                    order_id = order_data["shootproof_order_id"]
+                    if order_id in existing_orders:
+                        skipped += 1
+                        continue
+                    existing_orders.add(order_id)
+
+                    orders.append((family_id, order_data))
+
+                    created += 1
+                    if verbose:
+                        total = order_data["total_sales"]
+                        if total > 0:
+                            print(f"  Order #{order_id}: {order_data['gallery_name']} - ${total:.2f}")
+                        else:
+                            print(f"  Order #{order_id}: {order_data['gallery_name']} - $0 (comp)")
+
+                # Overlap this chunk's write with parsing the next; writes stay in order
+                if pending_write:
+                    await pending_write
                 if not dry_run:
-                    db.query(
-                        """CREATE type::thing('family', $id) CONTENT {
-                            name: $name,
-                            last_name: $last_name,
-                            delivery_email: $email
-                        }""",
-                        {"id": family_id, "name": gallery, "last_name": last_name, "email": customer_email}
-                    )
-
-            # Parse date
-            try:
-                if ',' in order_date:  # "Jan 2, 2025" format
-                    parsed_date = datetime.strptime(order_date, "%b %d, %Y")
-                else:
-                    parsed_date = datetime.strptime(order_date, "%Y-%m-%d")
-                order_date_iso = parsed_date.isoformat()
-            except:
-                order_date_iso = order_date
-
-            # Parse amounts
-            try:
-                total = float(total_sales) if total_sales else 0.0
-            except:
-                total = 0.0
-            try:
-                net_profit = float(profit) if profit else 0.0
-            except:
-                net_profit = 0.0
-
-            # Determine if this is a $0 order (comp/correction)
-            is_comp = total == 0.0
-
-            # Count items
-            item_count = len(items_ordered.split('\n')) if items_ordered else 0
-
-            # Check if order already exists
-            existing_order = db.query(
-                "SELECT * FROM order WHERE shootproof_order_id = $order_id",
-                {"order_id": int(order_id)}
-            )
-
-            # surrealdb Python client returns [] when empty, or list of records when found
-            has_order = existing_order and len(existing_order) > 0
-
-            if has_order:
-                skipped += 1
-                continue
-
-            order_data = {
-                "shootproof_order_id": int(order_id),
-                "order_date": order_date_iso,
-                "gallery_name": gallery,
-                "customer_name": customer_name,
-                "customer_email": customer_email,
-                "total_sales": total,
-                "profit": net_profit,
-                "is_comp": is_comp,
-                "item_count": item_count,
-                "items_raw": items_ordered[:500] if items_ordered else None,  # Truncate for storage
-            }
-
-            if not dry_run:
-                # Create order
-                result = db.query(
-                    "CREATE order CONTENT $data",
-                    {"data": order_data}
-                )
+                    pending_write = asyncio.create_task(write_orders(pool, new_families, orders))
 
-                # Link order to family
-                if result and len(result) > 0 and result[0].get('result'):
-                    order_record_id = result[0]['result'][0]['id']
-                    db.query(
-                        """RELATE type::thing('family', $family_id)->ordered->$order_id SET
-                            amount = $amount,
-                            order_date = $date""",
-                        {
-                            "family_id": family_id,
-                            "order_id": order_record_id,
-                            "amount": total,
-                            "date": order_date_iso
-                        }
-                    )
-
-            created += 1
-            if total > 0:
-                print(f"  Order #{order_id}: {gallery} - ${total:.2f}")
-            else:
-                print(f"  Order #{order_id}: {gallery} - $0 (comp)")
+                report_progress('orders', rows_read, rows_read + len(rows))
+                rows_read += len(rows)
+
+        if pending_write:
+            await pending_write
+    finally:
+        # On failure, don't leave a write or lookup running on a pooled connection
+        await cancel_and_wait(pending_write, family_lookup, order_lookup)
 
     print(f"\nOrders summary: {created} created, {skipped} skipped")
     if families_not_found:
@@ -241,6 +574,7 @@ def main():
     parser.add_argument('--contacts', type=str, help='Path to contacts CSV')
     parser.add_argument('--orders', type=str, help='Path to orders CSV')
     parser.add_argument('--dry-run', action='store_true', help='Preview without making changes')
+    parser.add_argument('--verbose', action='store_true', help='Print a line for every family and order')
     parser.add_argument('--all-2025', action='store_true', help='Import all 2025 data from standard paths')
 
     args = parser.parse_args()
@@ -256,24 +590,50 @@ def main():
         parser.print_help()
         return
 
+    asyncio.run(run_import(args.contacts, args.orders, args.dry_run, args.verbose))
+    sys.stdout.flush()
+
+
+async def run_import(contacts: str, orders: str, dry_run: bool, verbose: bool):
     # Connect to database
-    db = Surreal(DB_URL)
-    db.signin({"username": DB_USER, "password": DB_PASS})
-    db.use(DB_NS, DB_NAME)
+    pool = SurrealPool()
+    await pool.open()
 
     print(f"Connected to {DB_NS}/{DB_NAME}")
 
-    try:
-        if args.contacts:
-            import_contacts(db, args.contacts, args.dry_run)
+    # Families known to exist, shared so orders don't re-check what contacts wrote
+    families_seen = set()
+    # Orders overlap contacts only for their first chunk, then wait for its families
+    families_ready = asyncio.Event()
+    if not contacts:
+        families_ready.set()
 
-        if args.orders:
-            import_orders(db, args.orders, args.dry_run)
+    try:
+        await define_schema(pool, dry_run)
+
+        jobs = []
+        if contacts:
+            jobs.append(asyncio.create_task(
+                import_contacts(pool, contacts, dry_run, verbose, families_seen, families_ready)
+            ))
+        if orders:
+            jobs.append(asyncio.create_task(
+                import_orders(pool, orders, dry_run, verbose, families_seen, families_ready)
+            ))
+
+        try:
+            await asyncio.gather(*jobs)
+        except BaseException:
+            for job in jobs:
+                job.cancel()
+            # Let each import cancel its own in-flight writes before the pool closes
+            await asyncio.gather(*jobs, return_exceptions=True)
+            raise
 
         print("\n✅ Import complete!")
 
     finally:
-        db.close()
+        await pool.close()
 
 
 if __name__ == '__main__':